@@ -4,83 +4,402 @@ app.py
 Main application module for the Masterblog Flask project.
 
 This script serves as the entry point for a simple web-based blog system that allows users
-to create, read, update, delete, and like blog posts. Blog entries are stored as JSON data
-in a local file-based storage (`data/posts.json`), and the user interface is rendered via HTML templates.
+to create, read, update, delete, and like blog posts. Blog entries are stored as MessagePack data
+in a local file-based storage (`data/posts.msgpack`), and the user interface is rendered via HTML templates.
 
 Features:
 - Route-based blog interaction via Flask: add, edit, delete, and like blog posts
-- JSON-backed persistent data storage with structured read/write helpers
+- MessagePack-backed persistent data storage with structured read/write helpers
 - HTML interface using Jinja2 templates
 - RESTful endpoint structure for managing blog post lifecycle
 - Basic like feature implemented to allow post engagement
 
+Classes:
+- `Post` holds a single blog post in a compact, slot-based layout
+
 Functions:
-- `load_posts()` and `save_posts()` manage I/O access to the blog post JSON file
-- `fetch_post_by_id()` retrieves a single post by ID
+- `load_posts()` and `save_posts()` manage I/O access to the blog post MessagePack file
+- `set_post()`, `remove_post()`, and `increment_likes()` apply single-post changes to the store
+- `flush_posts()` persists like counts buffered by `increment_likes()`
+- `sort_posts()` builds the display order of the posts by creation time
+- `render_post()` renders the HTML fragment of a single post for the homepage
+- `add_static_version()` and `cache_static_assets()` enable long-lived caching of static assets
 - `index()`, `add()`, `update()`, `delete()`, and `like()` define the application’s main routes
 
 Required modules:
 - Flask: Core web framework (routes, request handling, rendering)
-- json: File-based structured data persistence
-- uuid: Post ID generation
+- msgpack: Compact binary encoding for file-based structured data persistence
+- os, threading: File modification checks and locking for the in-memory post cache
+- atexit: Persisting buffered likes on shutdown
+- time: Creation timestamps of new posts
+- bisect: Keeping the display order of the posts sorted
+- jinja2: Bytecode cache for compiled templates
+- secrets: Post ID generation
 
 Author: Martin Haferanke
 Date: 25.06.2025
 """
 
-import json
+import atexit
+import bisect
 import logging
-import uuid
+import os
+import secrets
+import threading
+import time
 
+import msgpack
+from jinja2 import FileSystemBytecodeCache
 from flask import Flask, redirect, url_for
-from flask import render_template, request
+from flask import make_response, render_template, request
+from werkzeug.http import is_resource_modified
+
+# Absolute paths, resolved once, so file checks on the request path do not depend
+# on the working directory
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+POSTS_FILE = os.path.join(BASE_DIR, "data", "posts.msgpack")
+POSTS_TMP_FILE = POSTS_FILE + ".tmp"
+# Storage file of earlier versions, converted by migrate_posts.py
+LEGACY_POSTS_FILE = os.path.join(BASE_DIR, "data", "posts.json")
+JINJA_CACHE_DIR = os.path.join(BASE_DIR, ".jinja_cache")
 
 app = Flask(__name__)
+# Static files are requested with a version query (see `add_static_version()`),
+# so browsers may keep them for a year
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 31536000
+
+# Templates only change on deploy: skip the per-render source checks and keep
+# compiled templates on disk across restarts. Jinja does not handle write errors
+# of the bytecode cache, so it is only enabled if its directory is writable.
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+app.jinja_env.auto_reload = False
+try:
+    os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+    if not os.access(JINJA_CACHE_DIR, os.W_OK):
+        raise PermissionError(f"{JINJA_CACHE_DIR} is not writable")
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+except OSError as e:
+    logging.warning(f"Template bytecode cache disabled: {e}")
+
+# Decoded contents of the posts file, reused while the file's mtime is unchanged.
+# "ids" is the set of known post IDs, "order" holds (created_at, post_id) pairs
+# in display order, "version" is a counter bumped on every change to the cached
+# data, "dirty" marks in-memory changes (likes) that have not been written yet.
+_POSTS_CACHE = {
+    "mtime": 0,
+    "version": 0,
+    "data": {},
+    "ids": set(),
+    "order": [],
+    "dirty": False,
+}
+_POSTS_LOCK = threading.RLock()
+
+# Rendered homepage HTML and the cache version it was rendered from
+_INDEX_CACHE = {"page": (None, "")}
+
+# Per-process ETag prefix, so ETags handed out by an earlier process never match
+# the restarted version counter
+_ETAG_PREFIX = secrets.token_hex(4)
+
+# Seconds to buffer like increments before writing them to disk
+FLUSH_INTERVAL = 2.0
+_flush_timer: threading.Timer | None = None
+
+
+# Models
+class Post:
+    """
+    A single blog post. Uses `__slots__` instead of a per-instance `__dict__`, which
+    keeps the in-memory post cache compact.
+
+    `_html` holds the rendered homepage fragment of the post; it is kept in memory
+    only and is not part of the persisted fields listed in `FIELDS`.
+    """
+
+    __slots__ = ("author", "title", "content", "likes", "created_at", "_html")
+    FIELDS = ("author", "title", "content", "likes", "created_at")
+    FIELD_TYPES = {
+        "author": str,
+        "title": str,
+        "content": str,
+        "likes": int,
+        "created_at": (int, float),
+    }
+
+    def __init__(
+        self,
+        author: str = "Anonymous",
+        title: str = "Untitled",
+        content: str = "",
+        likes: int = 0,
+        created_at: float = 0.0,
+    ) -> None:
+        self.author = author
+        self.title = title
+        self.content = content
+        self.likes = likes
+        self.created_at = created_at
+        self._html: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Post":
+        """
+        Create a post from its stored representation, ignoring unknown keys. Missing
+        fields fall back to their defaults; fields of the wrong type are rejected, as
+        sorting and liking rely on them.
+
+        :param data: A dictionary with the post fields.
+        :return: The created post.
+        :raises ValueError: If a field does not have the type listed in `FIELD_TYPES`.
+        """
+        fields = {k: data[k] for k in cls.FIELDS if k in data}
+        for key, value in fields.items():
+            # bool is a subclass of int but no valid count or timestamp
+            if isinstance(value, bool) or not isinstance(value, cls.FIELD_TYPES[key]):
+                raise ValueError(f"invalid value for {key}: {value!r}")
+        if "created_at" in fields:
+            fields["created_at"] = float(fields["created_at"])
+        return cls(**fields)
+
+    def to_dict(self) -> dict:
+        """
+        Return the persisted fields of the post as a dictionary.
+
+        :return: A dictionary with the post fields.
+        """
+        return {k: getattr(self, k) for k in self.FIELDS}
+
+
+# Encoder for `save_posts()`. With autoreset disabled the packer keeps its internal
+# buffer between saves, so writes reuse one allocation instead of building a new
+# bytes object each time. Only used while holding `_POSTS_LOCK`.
+_POSTS_PACKER = msgpack.Packer(default=Post.to_dict, autoreset=False)
 
 
 # Helpers
-def load_posts() -> dict[str, dict]:
+def _cached_posts() -> dict[str, Post] | None:
+    """
+    Return the cached posts if they are still current, otherwise None.
+
+    Writers store "data" before "mtime", so a matching mtime always refers to the
+    data that belongs to it.
+    """
+    if _POSTS_CACHE["dirty"]:
+        return _POSTS_CACHE["data"]
+    if os.stat(POSTS_FILE).st_mtime_ns == _POSTS_CACHE["mtime"]:
+        return _POSTS_CACHE["data"]
+    return None
+
+
+def _needs_migration() -> bool:
+    """
+    Check for posts in the former JSON format that have not been migrated yet. Writing
+    a new MessagePack file in that state would make `migrate_posts.py` refuse to run, so
+    the JSON posts would never be carried over.
+
+    :return: True (and logs an error) if only the JSON posts file exists.
     """
-    Loads posts from a JSON file into a dictionary. The function attempts to read data
-    from the "data/posts.json" file and parse its content as JSON. In case of errors
-    such as file not found, invalid JSON format, or file access issues, the function
-    logs the error and returns an empty dictionary.
+    if os.path.exists(POSTS_FILE) or not os.path.exists(LEGACY_POSTS_FILE):
+        return False
+    logging.error(
+        "Error loading posts: found data/posts.json but no data/posts.msgpack, "
+        "run `python migrate_posts.py` before adding posts"
+    )
+    return True
 
-    :return: A dictionary containing the content of the posts.json file. Returns an
-        empty dictionary if an error occurs during the file read or parsing process.
-    :rtype: dict[str, dict]
+
+def _refresh_posts() -> bool:
+    """
+    Make sure the cache reflects the posts file, reloading it if it changed. A missing
+    file counts as an empty store only as long as no posts file has been loaded yet
+    (a new blog); once one has been loaded, its disappearance is an error.
+
+    Load failures are reported instead of being treated as an empty store, so callers
+    never write an empty collection over posts that merely failed to load.
+
+    :return: True if the cache is current, False if the posts file could not be loaded.
     """
     try:
-        with open("data/posts.json", "r") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError, PermissionError, OSError) as e:
+        if _cached_posts() is not None:
+            return True
+
+        with _POSTS_LOCK:
+            # Another thread may have reloaded or saved while we were waiting
+            if _cached_posts() is not None:
+                return True
+
+            mtime = os.stat(POSTS_FILE).st_mtime_ns
+            with open(POSTS_FILE, "rb") as f:
+                stored = msgpack.unpackb(f.read())
+            if not isinstance(stored, dict):
+                raise ValueError("posts file does not contain a mapping of posts")
+
+            posts = {}
+            for post_id, data in stored.items():
+                # Skip malformed entries instead of discarding the whole store
+                if not isinstance(data, dict):
+                    logging.error(f"Error loading post {post_id}: invalid post data")
+                    continue
+                try:
+                    posts[post_id] = Post.from_dict(data)
+                except ValueError as e:
+                    logging.error(f"Error loading post {post_id}: {e}")
+
+            _POSTS_CACHE["data"] = posts
+            _POSTS_CACHE["ids"] = set(posts)
+            _POSTS_CACHE["order"] = sort_posts(posts)
+            _POSTS_CACHE["version"] += 1
+            _POSTS_CACHE["mtime"] = mtime
+            return True
+    except FileNotFoundError as e:
+        if _needs_migration():
+            return False
+        if _POSTS_CACHE["mtime"] == 0:
+            return True
+        logging.error(f"Error loading posts: {e}")
+        return False
+    except (
+        msgpack.UnpackException,
+        ValueError,
+        TypeError,
+        PermissionError,
+        OSError,
+    ) as e:
         logging.error(f"Error loading posts: {e}")
+        return False
+
+
+def load_posts() -> dict[str, Post]:
+    """
+    Loads posts from a MessagePack file into a dictionary. The function attempts to read
+    data from the "data/posts.msgpack" file and decode its content into `Post` objects.
+    The decoded result is cached in memory and returned as-is on subsequent calls as
+    long as the file's modification time is unchanged, or while the cache holds changes
+    that have not been flushed yet. This check runs without taking the lock; since
+    `save_posts()` replaces the file atomically, a reader never observes a partially
+    written file, and since `set_post()` and `remove_post()` swap in new collections
+    instead of changing the cached ones in place, a returned dictionary never changes
+    size. In case of errors such as file not found, invalid MessagePack data, or file
+    access issues, the function logs the error and returns an empty dictionary. If only
+    the JSON file of earlier versions exists, the logged error points to
+    `migrate_posts.py`.
+
+    :return: A dictionary mapping post IDs to the posts of the posts.msgpack file. Returns
+        an empty dictionary if an error occurs during the file read or parsing process.
+    :rtype: dict[str, Post]
+    """
+    if not _refresh_posts():
         return {}
+    return _POSTS_CACHE["data"]
 
 
-def save_posts(posts: dict[str, dict]) -> None:
+# Posts, display order, post IDs, and version of the post cache at one point in time
+PostsSnapshot = tuple[dict[str, Post], list[tuple[float, str]], set[str], int]
+
+
+def _snapshot_posts() -> PostsSnapshot | None:
     """
-    Saves a collection of posts to a JSON file. This function takes a dictionary where the
-    keys are strings representing post identifiers, and the values are dictionaries
-    containing post data. It validates the provided data, ensuring it adheres to the expected
-    structure, and logs an error message if the data is invalid. If valid, the posts are
-    serialized into a JSON file named "data/posts.json". Proper error handling is implemented
-    to manage file-related issues during this operation.
+    Return the cached posts, their display order, their IDs, and the cache version as
+    one consistent snapshot, refreshing the cache from disk first if needed.
+
+    :return: A tuple of the posts dictionary, the display order, the set of post IDs,
+        and the version, or None if the posts file could not be loaded.
+    """
+    with _POSTS_LOCK:
+        if not _refresh_posts():
+            return None
+        return (
+            _POSTS_CACHE["data"],
+            _POSTS_CACHE["order"],
+            _POSTS_CACHE["ids"],
+            _POSTS_CACHE["version"],
+        )
+
+
+def save_posts(
+    posts: dict[str, Post],
+    order: list[tuple[float, str]] | None = None,
+    ids: set[str] | None = None,
+) -> bool:
+    """
+    Saves a collection of posts to a MessagePack file. This function takes a dictionary
+    where the keys are strings representing post identifiers, and the values are `Post`
+    objects. It checks that the provided collection is a dictionary and logs an error
+    message if it is not; individual posts are validated by `set_post()` when they enter
+    the collection. If valid, the persisted fields of each post (see `Post.to_dict()`)
+    are packed with a reused encoder buffer into a file named "data/posts.msgpack".
+    The data is first written and synced to "data/posts.msgpack.tmp", which then
+    atomically replaces the original file. Only once the file is in place is the
+    in-memory cache switched to the saved posts, so the next call to `load_posts()`
+    does not re-read the file and a failed write leaves the cache untouched. Proper
+    error handling is implemented to manage file-related issues during this operation.
 
     :param posts: A dictionary where keys are strings representing post identifiers, and
-        values are dictionaries containing the post details.
+        values are the corresponding `Post` objects.
+    :param order: The display order of `posts`, if already known; rebuilt otherwise.
+    :param ids: The set of keys of `posts`, if already known; rebuilt otherwise.
+    :return: True if the posts were saved, False otherwise.
     """
-    if not isinstance(posts, dict) or not all(
-        isinstance(v, dict) for v in posts.values()
-    ):
+    if not isinstance(posts, dict):
         logging.error("Error: Invalid posts data")
-        return
+        return False
 
     try:
-        with open("data/posts.json", "w") as f:
-            json.dump(posts, f, indent=4)
-    except (FileNotFoundError, json.JSONDecodeError, PermissionError, OSError) as e:
+        with _POSTS_LOCK:
+            _POSTS_PACKER.reset()
+            _POSTS_PACKER.pack(posts)
+
+            fd = os.open(POSTS_TMP_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            with os.fdopen(fd, "wb") as f, _POSTS_PACKER.getbuffer() as buf:
+                f.write(buf)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(POSTS_TMP_FILE, POSTS_FILE)
+
+            mtime = os.stat(POSTS_FILE).st_mtime_ns
+            if posts is not _POSTS_CACHE["data"]:
+                _POSTS_CACHE["ids"] = set(posts) if ids is None else ids
+                _POSTS_CACHE["order"] = sort_posts(posts) if order is None else order
+                _POSTS_CACHE["version"] += 1
+            _POSTS_CACHE["data"] = posts
+            _POSTS_CACHE["mtime"] = mtime
+            _POSTS_CACHE["dirty"] = False
+            return True
+    except (FileNotFoundError, TypeError, PermissionError, OSError) as e:
         logging.error(f"Error saving posts: {e}")
+        return False
+
+
+def flush_posts() -> None:
+    """
+    Write buffered in-memory changes to disk if there are any. Called periodically
+    after likes and once more when the process exits. A failed write is retried
+    after another `FLUSH_INTERVAL`.
+    """
+    global _flush_timer
+
+    with _POSTS_LOCK:
+        _flush_timer = None
+        if _POSTS_CACHE["dirty"] and not save_posts(_POSTS_CACHE["data"]):
+            _schedule_flush()
+
+
+def _schedule_flush() -> None:
+    """
+    Start a background timer that calls `flush_posts()` after `FLUSH_INTERVAL`
+    seconds, unless one is already pending.
+    """
+    global _flush_timer
+
+    with _POSTS_LOCK:
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(FLUSH_INTERVAL, flush_posts)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+atexit.register(flush_posts)
 
 
 def validate_post_form_data() -> tuple[str, str, str] | tuple[None, None, None]:
@@ -104,27 +423,211 @@ def validate_post_form_data() -> tuple[str, str, str] | tuple[None, None, None]:
     return author, title, content
 
 
-def fetch_post_by_id(post_id: str) -> dict | None:
+def sort_posts(posts: dict[str, Post]) -> list[tuple[float, str]]:
     """
-    Retrieve a single blog post by ID.
+    Build the display order of the given posts, oldest first. Posts stored before
+    creation times were recorded keep their original order ahead of newer posts.
 
-    :param post_id: The ID of the post to retrieve.
-    :return: The post dictionary or None if not found.
+    :param posts: A dictionary of posts keyed by post ID.
+    :return: A list of (created_at, post_id) pairs in display order.
     """
-    blog_posts = load_posts()
-    return blog_posts.get(post_id)
+    return sorted(
+        ((post.created_at, post_id) for post_id, post in posts.items()),
+        key=lambda entry: entry[0],
+    )
+
+
+def render_post(post_id: str, post: Post) -> str:
+    """
+    Render the homepage HTML fragment of a single blog post. The result is stored
+    in the post's `_html` attribute, which is kept in memory only.
+
+    :param post_id: The ID of the post to render.
+    :param post: The post to render.
+    :return: The rendered HTML fragment.
+    """
+    return render_template("post.html", post_id=post_id, post=post)
+
+
+def set_post(post_id: str, post: Post) -> bool:
+    """
+    Insert or replace a single blog post and persist the change. New posts are
+    inserted into the display order by their creation time; replaced posts keep their
+    position. The change is made on copies of the cached collections, which only
+    replace the cache once the file has been written. Logs an error and leaves the
+    store untouched if the post is not a `Post` object, the stored posts could not be
+    loaded or `data/posts.json` still has to be migrated, so no write ever replaces
+    posts that are not in the cache.
+
+    :param post_id: The ID of the post to store.
+    :param post: The post to store under the given ID.
+    :return: True if the post was stored, False otherwise.
+    """
+    if not isinstance(post, Post):
+        logging.error("Error: Invalid post data")
+        return False
+
+    with _POSTS_LOCK:
+        snapshot = _snapshot_posts()
+        if snapshot is None:
+            return False
+
+        # Checked on every write, not only when the cache is reloaded
+        if _needs_migration():
+            return False
+
+        blog_posts, order, ids, _ = snapshot
+        if post_id not in blog_posts:
+            order = order.copy()
+            bisect.insort(order, (post.created_at, post_id))
+            ids = ids | {post_id}
+
+        posts = dict(blog_posts)
+        posts[post_id] = post
+        return save_posts(posts, order, ids)
+
+
+def remove_post(post_id: str) -> bool:
+    """
+    Delete a single blog post and persist the change. As in `set_post()`, the cache
+    is only updated once the file has been written, and nothing is written if the
+    stored posts could not be loaded.
+
+    :param post_id: The ID of the post to delete.
+    :return: True if the post existed and was removed, False otherwise.
+    """
+    with _POSTS_LOCK:
+        snapshot = _snapshot_posts()
+        if snapshot is None:
+            return False
+
+        blog_posts, order, ids, _ = snapshot
+        if post_id not in blog_posts:
+            return False
+
+        posts = dict(blog_posts)
+        del posts[post_id]
+        order = [entry for entry in order if entry[1] != post_id]
+        return save_posts(posts, order, ids - {post_id})
+
+
+def increment_likes(post_id: str) -> bool:
+    """
+    Increment the like counter of a single blog post. The change is applied to the
+    in-memory cache right away and written to disk by the next `flush_posts()` run,
+    so a burst of likes results in a single file write.
+
+    :param post_id: The ID of the post to like.
+    :return: True if the post exists and was updated, False otherwise.
+    """
+    with _POSTS_LOCK:
+        blog_posts = load_posts()
+        post = blog_posts.get(post_id)
+        if post is None:
+            return False
+        post.likes += 1
+        # The fragment shows the like count, re-render it on the next index hit
+        post._html = None
+        _POSTS_CACHE["version"] += 1
+        _POSTS_CACHE["dirty"] = True
+        _schedule_flush()
+        return True
+
+
+# Warm the post cache at startup so the first request does not read the file
+load_posts()
+
+
+# Hooks
+@app.url_defaults
+def add_static_version(endpoint: str, values: dict) -> None:
+    """
+    Append the file's modification time as a `v` query parameter to static URLs, so
+    the URL changes whenever the asset does and long browser caching stays safe.
+
+    :param endpoint: The endpoint a URL is being built for.
+    :param values: The URL values, updated in place.
+    """
+    if endpoint != "static" or "filename" not in values:
+        return
+
+    try:
+        path = os.path.join(app.static_folder, values["filename"])
+        values["v"] = int(os.stat(path).st_mtime)
+    except OSError:
+        pass
+
+
+@app.after_request
+def cache_static_assets(response):
+    """
+    Mark successfully served, versioned static assets as immutable so returning
+    visitors do not revalidate them. Error responses are left alone, so a missing
+    asset is not cached for a year.
+
+    :param response: The outgoing response.
+    :return: The response with updated caching headers.
+    """
+    if (
+        response.status_code == 200
+        and request.path.startswith("/static/")
+        and "v" in request.args
+    ):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
 
 
 # Routes
 @app.route("/")
 def index():
     """
-    Render the homepage displaying all blog posts.
-
-    :return: Rendered HTML page with the list of posts.
+    Render the homepage displaying all blog posts. The response carries an ETag derived
+    from the post cache version, so clients that already hold the current page get an
+    empty 304 response without re-rendering. Other clients receive the rendered HTML,
+    which is cached until the cache version changes. No Last-Modified header is sent:
+    its one-second resolution would hide changes made within the same second.
+    The page is assembled from per-post HTML fragments; only posts without a current
+    fragment are rendered, and the new fragments are kept for later requests unless a
+    post changed in the meantime.
+
+    :return: Rendered HTML page with the list of posts, a 304 Not Modified response, or
+        an error response if the posts could not be loaded.
     """
-    blog_posts = load_posts()
-    return render_template("index.html", posts=blog_posts)
+    snapshot = _snapshot_posts()
+    if snapshot is None:
+        return "Error loading posts", 500
+
+    blog_posts, order, _, version = snapshot
+    etag = f"{_ETAG_PREFIX}-{version}"
+
+    if is_resource_modified(request.environ, etag=etag):
+        page_version, html = _INDEX_CACHE["page"]
+        if page_version != version:
+            fragments = {}
+            rendered = {}
+            for post_id, post in blog_posts.items():
+                fragment = post._html
+                if fragment is None:
+                    fragment = rendered[post_id] = render_post(post_id, post)
+                fragments[post_id] = fragment
+
+            # Keep the new fragments only if no post changed while rendering, a
+            # like in the meantime may already be missing from them
+            with _POSTS_LOCK:
+                if _POSTS_CACHE["version"] == version:
+                    for post_id, fragment in rendered.items():
+                        blog_posts[post_id]._html = fragment
+
+            html = render_template("index.html", fragments=fragments, order=order)
+            _INDEX_CACHE["page"] = (version, html)
+        response = make_response(html)
+    else:
+        response = make_response("", 304)
+
+    response.set_etag(etag)
+    # Always revalidate, the page changes whenever a post is added or liked
+    response.cache_control.no_cache = True
+    return response
 
 
 @app.route("/add", methods=["GET", "POST"])
@@ -145,13 +648,13 @@ def add():
              to the index page.
     """
     if request.method == "POST":
-        post_id = str(uuid.uuid4())
+        post_id = secrets.token_hex(16)
         author, title, content = validate_post_form_data()
-        post = {"author": author, "title": title, "content": content, "likes": 0}
+        post = Post(author, title, content, created_at=time.time())
+        post._html = render_post(post_id, post)
 
-        blog_posts = load_posts()
-        blog_posts[post_id] = post
-        save_posts(blog_posts)
+        if not set_post(post_id, post):
+            return "Error saving post", 500
 
         return redirect(url_for("index"))
 
@@ -174,10 +677,9 @@ def delete(post_id: str):
     if post_id is None:
         return "Post ID not provided", 400
 
-    blog_posts = load_posts()
-    if post_id in blog_posts:
-        del blog_posts[post_id]
-        save_posts(blog_posts)
+    # Unknown IDs (e.g. stale links) need no further work
+    if post_id in _POSTS_CACHE["ids"] and not remove_post(post_id):
+        return "Error deleting post", 500
 
     return redirect(url_for("index"))
 
@@ -197,23 +699,28 @@ def update(post_id: str):
     if post_id is None:
         return "Post ID not provided", 400
 
+    if post_id not in _POSTS_CACHE["ids"]:
+        return "Post not found", 404
+
     blog_posts = load_posts()
-    post = fetch_post_by_id(post_id)
+    post = blog_posts.get(post_id)
     if post is None:
         return "Post not found", 404
 
     if request.method == "POST":
         author, title, content = validate_post_form_data()
 
-        updated_post = {
-            "author": author,
-            "title": title,
-            "content": content,
-            "likes": post.get("likes", 0),
-        }
+        updated_post = Post(
+            author,
+            title,
+            content,
+            likes=post.likes,
+            created_at=post.created_at,
+        )
+        updated_post._html = render_post(post_id, updated_post)
 
-        blog_posts[post_id] = updated_post
-        save_posts(blog_posts)
+        if not set_post(post_id, updated_post):
+            return "Error saving post", 500
 
         return redirect(url_for("index"))
 
@@ -229,17 +736,12 @@ def like(post_id: str):
     :param post_id: The ID of the post to like.
     :return: Redirect to the homepage.
     """
-
-    blog_posts = load_posts()
-
-    if post_id not in blog_posts:
+    if post_id not in _POSTS_CACHE["ids"] or not increment_likes(post_id):
         return "Post not found", 404
 
-    blog_posts[post_id]["likes"] = blog_posts[post_id].get("likes", 0) + 1
-    save_posts(blog_posts)
-
     return redirect(url_for("index"))
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # Development server only, use gunicorn in production (see README)
+    app.run(host="0.0.0.0", port=5000)
@@ -0,0 +1,87 @@
+"""
+migrate_posts.py
+
+One-shot migration script for the Masterblog Flask project.
+
+Converts blog posts stored in the former JSON format (`data/posts.json`) into the
+MessagePack file (`data/posts.msgpack`) read by `app.py`. The JSON file is left in
+place, so the migration can be verified before removing it. An existing MessagePack
+file is never overwritten unless `--force` is given, so posts stored there are not
+lost by running the migration twice.
+
+Usage:
+    python migrate_posts.py [--force] [source.json] [target.msgpack]
+
+Required modules:
+- argparse: Command line handling
+- json: Reading the legacy post file
+- msgpack: Writing the new post file
+- os: Default paths and atomic replacement of the target file
+
+Author: Martin Haferanke
+Date: 25.06.2025
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+import msgpack
+
+# Default paths next to this script, independent of the working directory
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SOURCE = os.path.join(BASE_DIR, "data", "posts.json")
+DEFAULT_TARGET = os.path.join(BASE_DIR, "data", "posts.msgpack")
+
+
+def migrate(source: str, target: str, force: bool = False) -> int:
+    """
+    Reads all posts from a JSON file and writes them to a MessagePack file. The data is
+    first written and synced to a temporary file next to the target, which then
+    atomically replaces it, the same way `app.save_posts()` writes.
+
+    :param source: Path of the JSON file to read.
+    :param target: Path of the MessagePack file to write.
+    :param force: Overwrite the target if it already exists.
+    :return: The number of migrated posts.
+    :raises FileExistsError: If the target exists and `force` is not set.
+    """
+    if os.path.exists(target) and not force:
+        raise FileExistsError(
+            f"{target} already exists, pass --force to overwrite the posts stored there"
+        )
+
+    with open(source, "r") as f:
+        posts = json.load(f)
+
+    tmp_target = target + ".tmp"
+    fd = os.open(tmp_target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    with os.fdopen(fd, "wb") as f:
+        f.write(msgpack.packb(posts))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_target, target)
+
+    return len(posts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert data/posts.json to data/posts.msgpack."
+    )
+    parser.add_argument("source", nargs="?", default=DEFAULT_SOURCE)
+    parser.add_argument("target", nargs="?", default=DEFAULT_TARGET)
+    parser.add_argument(
+        "--force", action="store_true", help="overwrite an existing target file"
+    )
+    args = parser.parse_args()
+
+    try:
+        count = migrate(args.source, args.target, args.force)
+    except (FileNotFoundError, json.JSONDecodeError, PermissionError, OSError) as e:
+        logging.error(f"Error migrating posts: {e}")
+        sys.exit(1)
+
+    print(f"Migrated {count} posts from {args.source} to {args.target}")